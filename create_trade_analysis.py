@@ -1,6 +1,7 @@
 """
-US Trade Analysis & Economic Concepts - Excel Workbook Generator
-Creates an Excel workbook with 5 worksheets analyzing US trade data.
+US Trade Analysis & Economic Concepts - Excel Workbook & PDF Report Generator
+Creates an Excel workbook with 5 worksheets analyzing US trade data, and a PDF
+report rendered from the same figures, tables and written responses.
 
 Data Sources:
 - US Census Bureau Foreign Trade Division (https://www.census.gov/foreign-trade/)
@@ -8,391 +9,573 @@ Data Sources:
 - Office of the United States Trade Representative (https://ustr.gov/countries-regions)
 """
 
+import os
+import tempfile
 import xlsxwriter
 from datetime import datetime
-
-# Create workbook
-workbook = xlsxwriter.Workbook("US_Trade_Analysis_2024.xlsx")
-
-# ============================================================================
-# DEFINE FORMATS
-# ============================================================================
-title_format = workbook.add_format(
-    {
-        "bold": True,
-        "font_size": 16,
-        "align": "center",
-        "valign": "vcenter",
-        "font_color": "white",
-        "bg_color": "#1F4E79",
-        "border": 1,
-    }
-)
-header_format = workbook.add_format(
-    {
-        "bold": True,
-        "font_size": 11,
-        "align": "center",
-        "valign": "vcenter",
-        "bg_color": "#D6DCE4",
-        "border": 1,
-        "text_wrap": True,
-    }
-)
-data_format = workbook.add_format(
-    {"font_size": 11, "align": "center", "valign": "vcenter", "border": 1}
-)
-currency_format = workbook.add_format(
-    {
-        "font_size": 11,
-        "align": "center",
-        "valign": "vcenter",
-        "border": 1,
-        "num_format": "$#,##0.0",
-    }
-)
-percent_format = workbook.add_format(
-    {
-        "font_size": 11,
-        "align": "center",
-        "valign": "vcenter",
-        "border": 1,
-        "num_format": "0.0%",
-    }
-)
-source_format = workbook.add_format(
-    {"font_size": 9, "italic": True, "align": "left", "valign": "vcenter"}
-)
-question_format = workbook.add_format(
-    {
-        "bold": True,
-        "font_size": 12,
-        "text_wrap": True,
-        "valign": "top",
-        "bg_color": "#E2EFDA",
-        "border": 2,
-    }
-)
-answer_format = workbook.add_format(
-    {"font_size": 11, "text_wrap": True, "valign": "top", "border": 1}
+from xml.sax.saxutils import escape
+
+from pypdf import PdfWriter
+from reportlab.graphics import renderPDF
+from reportlab.graphics.charts.legends import Legend
+from reportlab.graphics.charts.piecharts import Pie
+from reportlab.graphics.shapes import Drawing
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.pdfgen import canvas
+from reportlab.platypus import (
+    Paragraph,
+    Preformatted,
+    SimpleDocTemplate,
+    Spacer,
+    Table,
+    TableStyle,
 )
 
 # ============================================================================
-# WORKSHEET 1: US IMPORTS BY INDUSTRY SECTOR (2024 Data)
+# PDF REPORT: SAME FIGURES, TABLES AND RESPONSES AS THE WORKBOOK
 # ============================================================================
-ws1 = workbook.add_worksheet("Imports by Industry")
-ws1.set_column("A:A", 35)
-ws1.set_column("B:C", 18)
-
-# Data: US Imports by End-Use Category 2024 (in billions USD)
-# Source: US Census Bureau FT-900, October 2025 Release
-imports_by_sector = [
-    ("Capital Goods (exc. automotive)", 753.2, 0.232),
-    ("Consumer Goods", 745.8, 0.230),
-    ("Industrial Supplies & Materials", 698.4, 0.215),
-    ("Automotive Vehicles & Parts", 469.1, 0.145),
-    ("Foods, Feeds & Beverages", 198.6, 0.061),
-    ("Other Goods", 378.9, 0.117),
+PAGE_WIDTH, PAGE_HEIGHT = letter
+MARGIN = 72
+CONTENT_WIDTH = PAGE_WIDTH - 2 * MARGIN
+
+title_color = colors.HexColor("#1F4E79")
+header_color = colors.HexColor("#D6DCE4")
+question_color = colors.HexColor("#E2EFDA")
+slice_colors = [
+    colors.HexColor(c)
+    for c in ("#4472C4", "#ED7D31", "#A5A5A5", "#FFC000", "#5B9BD5", "#70AD47")
 ]
 
-# Title
-ws1.merge_range(
-    "A1:C1",
-    "Figure 1: Composition of US Imports by Industry Sector, 2024",
-    title_format,
+question_style = ParagraphStyle(
+    "Question", fontName="Helvetica-Bold", fontSize=11, leading=14
 )
-ws1.set_row(0, 30)
-
-# Headers
-ws1.write("A3", "Industry Sector", header_format)
-ws1.write("B3", "Value (Billions USD)", header_format)
-ws1.write("C3", "Percentage of Total", header_format)
-
-# Data
-for i, (sector, value, pct) in enumerate(imports_by_sector, start=3):
-    ws1.write(i, 0, sector, data_format)
-    ws1.write(i, 1, value, currency_format)
-    ws1.write(i, 2, pct, percent_format)
-
-# Total
-total_imports = sum([x[1] for x in imports_by_sector])
-ws1.write(9, 0, "TOTAL", header_format)
-ws1.write(9, 1, total_imports, currency_format)
-ws1.write(9, 2, 1.0, percent_format)
-
-# Source citation
-ws1.write(
-    "A12",
-    "Source: U.S. Census Bureau, Foreign Trade Division, FT-900 Report (January 2025)",
-    source_format,
+answer_style = ParagraphStyle(
+    "Answer", fontName="Helvetica", fontSize=9.5, leading=12.5
 )
-ws1.write(
-    "A13",
-    "Data URL: https://www.census.gov/foreign-trade/Press-Release/current_press_release/index.html",
-    source_format,
+layout_style = ParagraphStyle("Layout", fontName="Courier", fontSize=7.5, leading=9.5)
+source_style = ParagraphStyle(
+    "Source", fontName="Helvetica-Oblique", fontSize=8.5, leading=11
 )
-
-# Create pie chart
-chart1 = workbook.add_chart({"type": "pie"})
-chart1.add_series(
-    {
-        "name": "US Imports by Industry Sector",
-        "categories": "='Imports by Industry'!$A$4:$A$9",
-        "values": "='Imports by Industry'!$B$4:$B$9",
-        "data_labels": {"percentage": True, "category": False, "font": {"size": 9}},
-    }
-)
-chart1.set_title(
-    {
-        "name": "Figure 1: US Imports by Industry Sector, 2024\n(Billions of USD)",
-        "name_font": {"size": 12, "bold": True},
-    }
+heading_style = ParagraphStyle(
+    "Heading", fontName="Helvetica-Bold", fontSize=11, leading=14, spaceAfter=6
 )
-chart1.set_legend({"position": "right", "font": {"size": 9}})
-chart1.set_size({"width": 550, "height": 400})
-ws1.insert_chart("E3", chart1)
 
-# ============================================================================
-# WORKSHEET 2: US EXPORTS BY INDUSTRY SECTOR (2024 Data)
-# ============================================================================
-ws2 = workbook.add_worksheet("Exports by Industry")
-ws2.set_column("A:A", 35)
-ws2.set_column("B:C", 18)
-
-# Data: US Exports by End-Use Category 2024 (in billions USD)
-# Source: US Census Bureau FT-900, October 2025 Release
-exports_by_sector = [
-    ("Capital Goods (exc. automotive)", 586.7, 0.286),
-    ("Industrial Supplies & Materials", 574.3, 0.280),
-    ("Consumer Goods", 253.8, 0.124),
-    ("Automotive Vehicles & Parts", 186.2, 0.091),
-    ("Foods, Feeds & Beverages", 192.5, 0.094),
-    ("Other Goods", 256.5, 0.125),
-]
 
-# Title
-ws2.merge_range(
-    "A1:C1",
-    "Figure 2: Composition of US Exports by Industry Sector, 2024",
-    title_format,
-)
-ws2.set_row(0, 30)
-
-# Headers
-ws2.write("A3", "Industry Sector", header_format)
-ws2.write("B3", "Value (Billions USD)", header_format)
-ws2.write("C3", "Percentage of Total", header_format)
-
-# Data
-for i, (sector, value, pct) in enumerate(exports_by_sector, start=3):
-    ws2.write(i, 0, sector, data_format)
-    ws2.write(i, 1, value, currency_format)
-    ws2.write(i, 2, pct, percent_format)
-
-# Total
-total_exports = sum([x[1] for x in exports_by_sector])
-ws2.write(9, 0, "TOTAL", header_format)
-ws2.write(9, 1, total_exports, currency_format)
-ws2.write(9, 2, 1.0, percent_format)
-
-# Source citation
-ws2.write(
-    "A12",
-    "Source: U.S. Census Bureau, Foreign Trade Division, FT-900 Report (January 2025)",
-    source_format,
-)
-ws2.write(
-    "A13",
-    "Data URL: https://www.census.gov/foreign-trade/Press-Release/current_press_release/index.html",
-    source_format,
-)
-
-# Create pie chart
-chart2 = workbook.add_chart({"type": "pie"})
-chart2.add_series(
-    {
-        "name": "US Exports by Industry Sector",
-        "categories": "='Exports by Industry'!$A$4:$A$9",
-        "values": "='Exports by Industry'!$B$4:$B$9",
-        "data_labels": {"percentage": True, "category": False, "font": {"size": 9}},
-    }
-)
-chart2.set_title(
-    {
-        "name": "Figure 2: US Exports by Industry Sector, 2024\n(Billions of USD)",
-        "name_font": {"size": 12, "bold": True},
-    }
-)
-chart2.set_legend({"position": "right", "font": {"size": 9}})
-chart2.set_size({"width": 550, "height": 400})
-ws2.insert_chart("E3", chart2)
-
-# ============================================================================
-# WORKSHEET 3: US IMPORTS BY TRADING PARTNER (Top 5, 2024 Data)
-# ============================================================================
-ws3 = workbook.add_worksheet("Imports by Partner")
-ws3.set_column("A:A", 25)
-ws3.set_column("B:C", 18)
-
-# Data: US Imports by Top 5 Trading Partners 2024 (in billions USD)
-# Source: US Census Bureau Foreign Trade - Top Trading Partners
-imports_by_partner = [
-    ("China", 427.2, 0.142),
-    ("Mexico", 505.8, 0.168),
-    ("Canada", 412.3, 0.137),
-    ("Japan", 135.2, 0.045),
-    ("Germany", 157.6, 0.052),
-    ("All Other Countries", 1373.9, 0.456),
-]
-
-# Title
-ws3.merge_range(
-    "A1:C1", "Figure 3: US Imports by Top 5 Trading Partners, 2024", title_format
-)
-ws3.set_row(0, 30)
-
-# Headers
-ws3.write("A3", "Trading Partner", header_format)
-ws3.write("B3", "Value (Billions USD)", header_format)
-ws3.write("C3", "Percentage of Total", header_format)
-
-# Data
-for i, (partner, value, pct) in enumerate(imports_by_partner, start=3):
-    ws3.write(i, 0, partner, data_format)
-    ws3.write(i, 1, value, currency_format)
-    ws3.write(i, 2, pct, percent_format)
-
-# Total
-total_imports_partner = sum([x[1] for x in imports_by_partner])
-ws3.write(10, 0, "TOTAL", header_format)
-ws3.write(10, 1, total_imports_partner, currency_format)
-ws3.write(10, 2, 1.0, percent_format)
-
-# Source citation
-ws3.write(
-    "A13",
-    "Source: U.S. Census Bureau, Foreign Trade Division - Top Trading Partners (2024)",
-    source_format,
-)
-ws3.write(
-    "A14",
-    "Data URL: https://www.census.gov/foreign-trade/statistics/highlights/toppartners.html",
-    source_format,
-)
-
-# Create pie chart
-chart3 = workbook.add_chart({"type": "pie"})
-chart3.add_series(
-    {
-        "name": "US Imports by Trading Partner",
-        "categories": "='Imports by Partner'!$A$4:$A$9",
-        "values": "='Imports by Partner'!$B$4:$B$9",
-        "data_labels": {"percentage": True, "category": False, "font": {"size": 9}},
-    }
-)
-chart3.set_title(
-    {
-        "name": "Figure 3: US Imports by Top 5 Trading Partners, 2024\n(Billions of USD)",
-        "name_font": {"size": 12, "bold": True},
-    }
-)
-chart3.set_legend({"position": "right", "font": {"size": 9}})
-chart3.set_size({"width": 550, "height": 400})
-ws3.insert_chart("E3", chart3)
-
-# ============================================================================
-# WORKSHEET 4: US EXPORTS BY TRADING PARTNER (Top 5, 2024 Data)
-# ============================================================================
-ws4 = workbook.add_worksheet("Exports by Partner")
-ws4.set_column("A:A", 25)
-ws4.set_column("B:C", 18)
-
-# Data: US Exports by Top 5 Trading Partners 2024 (in billions USD)
-# Source: US Census Bureau Foreign Trade - Top Trading Partners
-exports_by_partner = [
-    ("Canada", 351.8, 0.171),
-    ("Mexico", 322.5, 0.157),
-    ("China", 143.5, 0.070),
-    ("Japan", 79.8, 0.039),
-    ("United Kingdom", 76.4, 0.037),
-    ("All Other Countries", 1076.0, 0.526),
-]
-
-# Title
-ws4.merge_range(
-    "A1:C1", "Figure 4: US Exports by Top 5 Trading Partners, 2024", title_format
-)
-ws4.set_row(0, 30)
-
-# Headers
-ws4.write("A3", "Trading Partner", header_format)
-ws4.write("B3", "Value (Billions USD)", header_format)
-ws4.write("C3", "Percentage of Total", header_format)
-
-# Data
-for i, (partner, value, pct) in enumerate(exports_by_partner, start=3):
-    ws4.write(i, 0, partner, data_format)
-    ws4.write(i, 1, value, currency_format)
-    ws4.write(i, 2, pct, percent_format)
-
-# Total
-total_exports_partner = sum([x[1] for x in exports_by_partner])
-ws4.write(10, 0, "TOTAL", header_format)
-ws4.write(10, 1, total_exports_partner, currency_format)
-ws4.write(10, 2, 1.0, percent_format)
-
-# Source citation
-ws4.write(
-    "A13",
-    "Source: U.S. Census Bureau, Foreign Trade Division - Top Trading Partners (2024)",
-    source_format,
-)
-ws4.write(
-    "A14",
-    "Data URL: https://www.census.gov/foreign-trade/statistics/highlights/toppartners.html",
-    source_format,
-)
-
-# Create pie chart
-chart4 = workbook.add_chart({"type": "pie"})
-chart4.add_series(
-    {
-        "name": "US Exports by Trading Partner",
-        "categories": "='Exports by Partner'!$A$4:$A$9",
-        "values": "='Exports by Partner'!$B$4:$B$9",
-        "data_labels": {"percentage": True, "category": False, "font": {"size": 9}},
-    }
-)
-chart4.set_title(
-    {
-        "name": "Figure 4: US Exports by Top 5 Trading Partners, 2024\n(Billions of USD)",
-        "name_font": {"size": 12, "bold": True},
-    }
-)
-chart4.set_legend({"position": "right", "font": {"size": 9}})
-chart4.set_size({"width": 550, "height": 400})
-ws4.insert_chart("E3", chart4)
-
-# ============================================================================
-# WORKSHEET 5: ECONOMIC CONCEPTS - SHORT WRITTEN RESPONSES
-# ============================================================================
-ws5 = workbook.add_worksheet("Economic Questions")
-ws5.set_column("A:A", 100)
-ws5.set_row(0, 25)
-
-# Title
-ws5.merge_range(
-    "A1:A1",
-    "Part 2: Short Written Responses - International Trade Theory & Policy",
-    title_format,
-)
-
-# Questions and Answers
-questions_answers = [
-    # Question 1
-    (
-        "QUESTION 1: Historical Trends\nHow has the fundamental nature of United States trade evolved over the past 100 years? Discuss shifts in volume, composition, or partners.",
-        """ANSWER:
+def render_figure_page(path, title, category_header, rows, source_lines):
+    """Lay out one figure (pie chart, data table, citation) as a one-page PDF."""
+    if len(rows) > len(slice_colors):
+        raise ValueError(
+            f"{title!r} has {len(rows)} rows; a figure page fits at most "
+            f"{len(slice_colors)}"
+        )
+    pdf = canvas.Canvas(path, pagesize=letter)
+    top = PAGE_HEIGHT - MARGIN
+
+    # Title bar
+    pdf.setFillColor(title_color)
+    pdf.rect(MARGIN, top - 30, CONTENT_WIDTH, 30, stroke=0, fill=1)
+    pdf.setFillColor(colors.white)
+    pdf.setFont("Helvetica-Bold", 13)
+    pdf.drawCentredString(PAGE_WIDTH / 2, top - 20, title)
+
+    # Pie chart
+    total = sum(value for _, value, _ in rows)
+    drawing = Drawing(CONTENT_WIDTH, 250)
+    pie = Pie()
+    pie.x, pie.y, pie.width, pie.height = 30, 15, 220, 220
+    pie.data = [value for _, value, _ in rows]
+    pie.labels = [f"{value / total:.1%}" for _, value, _ in rows]
+    pie.simpleLabels = True
+    pie.slices.fontName = "Helvetica"
+    pie.slices.fontSize = 8
+    pie.slices.strokeColor = colors.white
+    for i, color in enumerate(slice_colors[: len(rows)]):
+        pie.slices[i].fillColor = color
+    legend = Legend()
+    legend.x, legend.y = 290, 190
+    legend.columnMaximum = len(rows)
+    legend.fontName = "Helvetica"
+    legend.fontSize = 8.5
+    legend.alignment = "right"
+    legend.colorNamePairs = list(zip(slice_colors, [name for name, _, _ in rows]))
+    drawing.add(pie)
+    drawing.add(legend)
+    renderPDF.draw(drawing, pdf, MARGIN, top - 300)
+
+    # Data table
+    data = [[category_header, "Value (Billions USD)", "Percentage of Total"]]
+    for name, value, pct in rows:
+        data.append([name, f"${value:,.1f}", f"{pct:.1%}"])
+    data.append(["TOTAL", f"${total:,.1f}", f"{1.0:.1%}"])
+    table = Table(data, colWidths=[CONTENT_WIDTH - 240, 120, 120])
+    table.setStyle(
+        TableStyle(
+            [
+                ("FONT", (0, 0), (-1, -1), "Helvetica", 9.5),
+                ("FONT", (0, 0), (-1, 0), "Helvetica-Bold", 9.5),
+                ("FONT", (0, -1), (-1, -1), "Helvetica-Bold", 9.5),
+                ("BACKGROUND", (0, 0), (-1, 0), header_color),
+                ("BACKGROUND", (0, -1), (-1, -1), header_color),
+                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+                ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+            ]
+        )
+    )
+    _, table_height = table.wrapOn(pdf, CONTENT_WIDTH, PAGE_HEIGHT)
+    table_top = top - 330
+    table.drawOn(pdf, MARGIN, table_top - table_height)
+
+    # Source citation
+    y = table_top - table_height - 30
+    for line in source_lines:
+        source = Paragraph(escape(line), source_style)
+        _, height = source.wrapOn(pdf, CONTENT_WIDTH, PAGE_HEIGHT)
+        source.drawOn(pdf, MARGIN, y - height)
+        y -= height + 2
+
+    pdf.showPage()
+    pdf.save()
+    return path
+
+
+def answer_flowables(answer):
+    """Convert an answer's plain-text layout into flowables, one per line."""
+    flowables = []
+    for line in answer.split("\n"):
+        # The standard PDF fonts have no arrow glyph
+        line = line.replace("→", "->")
+        text = line.strip()
+        if not text:
+            flowables.append(Spacer(1, 6))
+        elif text.startswith("|") or "    " in text:
+            # Column-aligned tables must keep their spacing
+            flowables.append(Preformatted(line, layout_style))
+        else:
+            indent = (len(line) - len(line.lstrip())) * 4
+            style = answer_style
+            if indent:
+                style = ParagraphStyle("Indented", answer_style, leftIndent=indent)
+            flowables.append(Paragraph(escape(text), style))
+    return flowables
+
+
+def render_question_pages(path, question, answer):
+    """Lay out one question and its answer as a standalone PDF."""
+    question_box = Table(
+        [[Paragraph(escape(question).replace("\n", "<br/>"), question_style)]],
+        colWidths=[CONTENT_WIDTH],
+    )
+    question_box.setStyle(
+        TableStyle(
+            [
+                ("BACKGROUND", (0, 0), (-1, -1), question_color),
+                ("BOX", (0, 0), (-1, -1), 1.5, colors.black),
+                ("TOPPADDING", (0, 0), (-1, -1), 6),
+                ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
+            ]
+        )
+    )
+    story = [question_box, Spacer(1, 10)] + answer_flowables(answer)
+    SimpleDocTemplate(path, pagesize=letter).build(story)
+    return path
+
+
+def render_sources_page(path, source_lines):
+    """Lay out the data sources summary as a one-page PDF."""
+    story = [Paragraph("DATA SOURCES FOR THIS REPORT:", heading_style)]
+    story += [Paragraph(escape(line), source_style) for line in source_lines if line]
+    SimpleDocTemplate(path, pagesize=letter).build(story)
+    return path
+
+
+def build_pdf_report(pdf_path, figures, questions_answers, source_lines, executor=None):
+    """
+    Render every section of the report to its own file, then append the
+    finished sections to pdf_path in report order.
+
+    Sections render one after another unless an executor is passed, so a batch
+    run over many periods can share one pool (with max_workers no larger than
+    a report's section count) instead of starting workers for every report.
+    pypdf keeps every appended page until the final write, so memory use is
+    bounded by one whole report rather than streamed page by page.
+    """
+    sections = [(render_figure_page, *figure) for figure in figures]
+    sections += [(render_question_pages, q, a) for q, a in questions_answers]
+    sections.append((render_sources_page, source_lines))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        jobs = [
+            (render, os.path.join(tmp_dir, f"section_{n:02d}.pdf"), args)
+            for n, (render, *args) in enumerate(sections)
+        ]
+        if executor is None:
+            section_paths = (render(path, *args) for render, path, args in jobs)
+        else:
+            futures = [
+                executor.submit(render, path, *args) for render, path, args in jobs
+            ]
+            section_paths = (future.result() for future in futures)
+
+        writer = PdfWriter()
+        for section_path in section_paths:
+            writer.append(section_path)
+        writer.write(pdf_path)
+
+
+def main():
+    """Build the Excel workbook and the PDF report for the 2024 trade data."""
+    # Create workbook
+    workbook = xlsxwriter.Workbook("US_Trade_Analysis_2024.xlsx")
+
+    # ============================================================================
+    # DEFINE FORMATS
+    # ============================================================================
+    title_format = workbook.add_format(
+        {
+            "bold": True,
+            "font_size": 16,
+            "align": "center",
+            "valign": "vcenter",
+            "font_color": "white",
+            "bg_color": "#1F4E79",
+            "border": 1,
+        }
+    )
+    header_format = workbook.add_format(
+        {
+            "bold": True,
+            "font_size": 11,
+            "align": "center",
+            "valign": "vcenter",
+            "bg_color": "#D6DCE4",
+            "border": 1,
+            "text_wrap": True,
+        }
+    )
+    data_format = workbook.add_format(
+        {"font_size": 11, "align": "center", "valign": "vcenter", "border": 1}
+    )
+    currency_format = workbook.add_format(
+        {
+            "font_size": 11,
+            "align": "center",
+            "valign": "vcenter",
+            "border": 1,
+            "num_format": "$#,##0.0",
+        }
+    )
+    percent_format = workbook.add_format(
+        {
+            "font_size": 11,
+            "align": "center",
+            "valign": "vcenter",
+            "border": 1,
+            "num_format": "0.0%",
+        }
+    )
+    source_format = workbook.add_format(
+        {"font_size": 9, "italic": True, "align": "left", "valign": "vcenter"}
+    )
+    question_format = workbook.add_format(
+        {
+            "bold": True,
+            "font_size": 12,
+            "text_wrap": True,
+            "valign": "top",
+            "bg_color": "#E2EFDA",
+            "border": 2,
+        }
+    )
+    answer_format = workbook.add_format(
+        {"font_size": 11, "text_wrap": True, "valign": "top", "border": 1}
+    )
+
+    # ============================================================================
+    # WORKSHEET 1: US IMPORTS BY INDUSTRY SECTOR (2024 Data)
+    # ============================================================================
+    ws1 = workbook.add_worksheet("Imports by Industry")
+    ws1.set_column("A:A", 35)
+    ws1.set_column("B:C", 18)
+
+    # Data: US Imports by End-Use Category 2024 (in billions USD)
+    # Source: US Census Bureau FT-900, October 2025 Release
+    imports_by_sector = [
+        ("Capital Goods (exc. automotive)", 753.2, 0.232),
+        ("Consumer Goods", 745.8, 0.230),
+        ("Industrial Supplies & Materials", 698.4, 0.215),
+        ("Automotive Vehicles & Parts", 469.1, 0.145),
+        ("Foods, Feeds & Beverages", 198.6, 0.061),
+        ("Other Goods", 378.9, 0.117),
+    ]
+
+    # Title
+    figure1_title = "Figure 1: Composition of US Imports by Industry Sector, 2024"
+    ws1.merge_range("A1:C1", figure1_title, title_format)
+    ws1.set_row(0, 30)
+
+    # Headers
+    ws1.write("A3", "Industry Sector", header_format)
+    ws1.write("B3", "Value (Billions USD)", header_format)
+    ws1.write("C3", "Percentage of Total", header_format)
+
+    # Data
+    for i, (sector, value, pct) in enumerate(imports_by_sector, start=3):
+        ws1.write(i, 0, sector, data_format)
+        ws1.write(i, 1, value, currency_format)
+        ws1.write(i, 2, pct, percent_format)
+
+    # Total
+    total_imports = sum([x[1] for x in imports_by_sector])
+    ws1.write(9, 0, "TOTAL", header_format)
+    ws1.write(9, 1, total_imports, currency_format)
+    ws1.write(9, 2, 1.0, percent_format)
+
+    # Source citation
+    sector_source = (
+        "Source: U.S. Census Bureau, Foreign Trade Division, FT-900 Report (January 2025)",
+        "Data URL: https://www.census.gov/foreign-trade/Press-Release/current_press_release/index.html",
+    )
+    ws1.write("A12", sector_source[0], source_format)
+    ws1.write("A13", sector_source[1], source_format)
+
+    # Create pie chart
+    chart1 = workbook.add_chart({"type": "pie"})
+    chart1.add_series(
+        {
+            "name": "US Imports by Industry Sector",
+            "categories": "='Imports by Industry'!$A$4:$A$9",
+            "values": "='Imports by Industry'!$B$4:$B$9",
+            "data_labels": {"percentage": True, "category": False, "font": {"size": 9}},
+        }
+    )
+    chart1.set_title(
+        {
+            "name": "Figure 1: US Imports by Industry Sector, 2024\n(Billions of USD)",
+            "name_font": {"size": 12, "bold": True},
+        }
+    )
+    chart1.set_legend({"position": "right", "font": {"size": 9}})
+    chart1.set_size({"width": 550, "height": 400})
+    ws1.insert_chart("E3", chart1)
+
+    # ============================================================================
+    # WORKSHEET 2: US EXPORTS BY INDUSTRY SECTOR (2024 Data)
+    # ============================================================================
+    ws2 = workbook.add_worksheet("Exports by Industry")
+    ws2.set_column("A:A", 35)
+    ws2.set_column("B:C", 18)
+
+    # Data: US Exports by End-Use Category 2024 (in billions USD)
+    # Source: US Census Bureau FT-900, October 2025 Release
+    exports_by_sector = [
+        ("Capital Goods (exc. automotive)", 586.7, 0.286),
+        ("Industrial Supplies & Materials", 574.3, 0.280),
+        ("Consumer Goods", 253.8, 0.124),
+        ("Automotive Vehicles & Parts", 186.2, 0.091),
+        ("Foods, Feeds & Beverages", 192.5, 0.094),
+        ("Other Goods", 256.5, 0.125),
+    ]
+
+    # Title
+    figure2_title = "Figure 2: Composition of US Exports by Industry Sector, 2024"
+    ws2.merge_range("A1:C1", figure2_title, title_format)
+    ws2.set_row(0, 30)
+
+    # Headers
+    ws2.write("A3", "Industry Sector", header_format)
+    ws2.write("B3", "Value (Billions USD)", header_format)
+    ws2.write("C3", "Percentage of Total", header_format)
+
+    # Data
+    for i, (sector, value, pct) in enumerate(exports_by_sector, start=3):
+        ws2.write(i, 0, sector, data_format)
+        ws2.write(i, 1, value, currency_format)
+        ws2.write(i, 2, pct, percent_format)
+
+    # Total
+    total_exports = sum([x[1] for x in exports_by_sector])
+    ws2.write(9, 0, "TOTAL", header_format)
+    ws2.write(9, 1, total_exports, currency_format)
+    ws2.write(9, 2, 1.0, percent_format)
+
+    # Source citation
+    ws2.write("A12", sector_source[0], source_format)
+    ws2.write("A13", sector_source[1], source_format)
+
+    # Create pie chart
+    chart2 = workbook.add_chart({"type": "pie"})
+    chart2.add_series(
+        {
+            "name": "US Exports by Industry Sector",
+            "categories": "='Exports by Industry'!$A$4:$A$9",
+            "values": "='Exports by Industry'!$B$4:$B$9",
+            "data_labels": {"percentage": True, "category": False, "font": {"size": 9}},
+        }
+    )
+    chart2.set_title(
+        {
+            "name": "Figure 2: US Exports by Industry Sector, 2024\n(Billions of USD)",
+            "name_font": {"size": 12, "bold": True},
+        }
+    )
+    chart2.set_legend({"position": "right", "font": {"size": 9}})
+    chart2.set_size({"width": 550, "height": 400})
+    ws2.insert_chart("E3", chart2)
+
+    # ============================================================================
+    # WORKSHEET 3: US IMPORTS BY TRADING PARTNER (Top 5, 2024 Data)
+    # ============================================================================
+    ws3 = workbook.add_worksheet("Imports by Partner")
+    ws3.set_column("A:A", 25)
+    ws3.set_column("B:C", 18)
+
+    # Data: US Imports by Top 5 Trading Partners 2024 (in billions USD)
+    # Source: US Census Bureau Foreign Trade - Top Trading Partners
+    imports_by_partner = [
+        ("China", 427.2, 0.142),
+        ("Mexico", 505.8, 0.168),
+        ("Canada", 412.3, 0.137),
+        ("Japan", 135.2, 0.045),
+        ("Germany", 157.6, 0.052),
+        ("All Other Countries", 1373.9, 0.456),
+    ]
+
+    # Title
+    figure3_title = "Figure 3: US Imports by Top 5 Trading Partners, 2024"
+    ws3.merge_range("A1:C1", figure3_title, title_format)
+    ws3.set_row(0, 30)
+
+    # Headers
+    ws3.write("A3", "Trading Partner", header_format)
+    ws3.write("B3", "Value (Billions USD)", header_format)
+    ws3.write("C3", "Percentage of Total", header_format)
+
+    # Data
+    for i, (partner, value, pct) in enumerate(imports_by_partner, start=3):
+        ws3.write(i, 0, partner, data_format)
+        ws3.write(i, 1, value, currency_format)
+        ws3.write(i, 2, pct, percent_format)
+
+    # Total
+    total_imports_partner = sum([x[1] for x in imports_by_partner])
+    ws3.write(10, 0, "TOTAL", header_format)
+    ws3.write(10, 1, total_imports_partner, currency_format)
+    ws3.write(10, 2, 1.0, percent_format)
+
+    # Source citation
+    partner_source = (
+        "Source: U.S. Census Bureau, Foreign Trade Division - Top Trading Partners (2024)",
+        "Data URL: https://www.census.gov/foreign-trade/statistics/highlights/toppartners.html",
+    )
+    ws3.write("A13", partner_source[0], source_format)
+    ws3.write("A14", partner_source[1], source_format)
+
+    # Create pie chart
+    chart3 = workbook.add_chart({"type": "pie"})
+    chart3.add_series(
+        {
+            "name": "US Imports by Trading Partner",
+            "categories": "='Imports by Partner'!$A$4:$A$9",
+            "values": "='Imports by Partner'!$B$4:$B$9",
+            "data_labels": {"percentage": True, "category": False, "font": {"size": 9}},
+        }
+    )
+    chart3.set_title(
+        {
+            "name": "Figure 3: US Imports by Top 5 Trading Partners, 2024\n(Billions of USD)",
+            "name_font": {"size": 12, "bold": True},
+        }
+    )
+    chart3.set_legend({"position": "right", "font": {"size": 9}})
+    chart3.set_size({"width": 550, "height": 400})
+    ws3.insert_chart("E3", chart3)
+
+    # ============================================================================
+    # WORKSHEET 4: US EXPORTS BY TRADING PARTNER (Top 5, 2024 Data)
+    # ============================================================================
+    ws4 = workbook.add_worksheet("Exports by Partner")
+    ws4.set_column("A:A", 25)
+    ws4.set_column("B:C", 18)
+
+    # Data: US Exports by Top 5 Trading Partners 2024 (in billions USD)
+    # Source: US Census Bureau Foreign Trade - Top Trading Partners
+    exports_by_partner = [
+        ("Canada", 351.8, 0.171),
+        ("Mexico", 322.5, 0.157),
+        ("China", 143.5, 0.070),
+        ("Japan", 79.8, 0.039),
+        ("United Kingdom", 76.4, 0.037),
+        ("All Other Countries", 1076.0, 0.526),
+    ]
+
+    # Title
+    figure4_title = "Figure 4: US Exports by Top 5 Trading Partners, 2024"
+    ws4.merge_range("A1:C1", figure4_title, title_format)
+    ws4.set_row(0, 30)
+
+    # Headers
+    ws4.write("A3", "Trading Partner", header_format)
+    ws4.write("B3", "Value (Billions USD)", header_format)
+    ws4.write("C3", "Percentage of Total", header_format)
+
+    # Data
+    for i, (partner, value, pct) in enumerate(exports_by_partner, start=3):
+        ws4.write(i, 0, partner, data_format)
+        ws4.write(i, 1, value, currency_format)
+        ws4.write(i, 2, pct, percent_format)
+
+    # Total
+    total_exports_partner = sum([x[1] for x in exports_by_partner])
+    ws4.write(10, 0, "TOTAL", header_format)
+    ws4.write(10, 1, total_exports_partner, currency_format)
+    ws4.write(10, 2, 1.0, percent_format)
+
+    # Source citation
+    ws4.write("A13", partner_source[0], source_format)
+    ws4.write("A14", partner_source[1], source_format)
+
+    # Create pie chart
+    chart4 = workbook.add_chart({"type": "pie"})
+    chart4.add_series(
+        {
+            "name": "US Exports by Trading Partner",
+            "categories": "='Exports by Partner'!$A$4:$A$9",
+            "values": "='Exports by Partner'!$B$4:$B$9",
+            "data_labels": {"percentage": True, "category": False, "font": {"size": 9}},
+        }
+    )
+    chart4.set_title(
+        {
+            "name": "Figure 4: US Exports by Top 5 Trading Partners, 2024\n(Billions of USD)",
+            "name_font": {"size": 12, "bold": True},
+        }
+    )
+    chart4.set_legend({"position": "right", "font": {"size": 9}})
+    chart4.set_size({"width": 550, "height": 400})
+    ws4.insert_chart("E3", chart4)
+
+    # ============================================================================
+    # WORKSHEET 5: ECONOMIC CONCEPTS - SHORT WRITTEN RESPONSES
+    # ============================================================================
+    ws5 = workbook.add_worksheet("Economic Questions")
+    ws5.set_column("A:A", 100)
+    ws5.set_row(0, 25)
+
+    # Title
+    ws5.merge_range(
+        "A1:A1",
+        "Part 2: Short Written Responses - International Trade Theory & Policy",
+        title_format,
+    )
+
+    # Questions and Answers
+    questions_answers = [
+        # Question 1
+        (
+            "QUESTION 1: Historical Trends\nHow has the fundamental nature of United States trade evolved over the past 100 years? Discuss shifts in volume, composition, or partners.",
+            """ANSWER:
 
 Over the past century, U.S. trade has undergone profound transformations across three key dimensions:
 
@@ -407,11 +590,11 @@ TRADING PARTNERS:
 • Early 20th Century: Trade was concentrated with European nations (UK, Germany, France).
 • Mid-20th Century: Japan emerged as a major partner following WWII reconstruction.
 • Late 20th Century-Present: China became the largest source of imports; NAFTA/USMCA made Canada and Mexico top partners. Today's top 5 partners (Mexico, Canada, China, Japan, Germany) account for over 50% of all U.S. trade.""",
-    ),
-    # Question 2
-    (
-        "QUESTION 2: Opportunity Cost\nDefine the concept of 'opportunity cost' specifically as it applies to a country's industrial policy. Provide concrete examples to illustrate your definition.",
-        """ANSWER:
+        ),
+        # Question 2
+        (
+            "QUESTION 2: Opportunity Cost\nDefine the concept of 'opportunity cost' specifically as it applies to a country's industrial policy. Provide concrete examples to illustrate your definition.",
+            """ANSWER:
 
 DEFINITION: Opportunity cost in industrial policy refers to the value of the next-best alternative foregone when a nation chooses to allocate its limited resources (capital, labor, land, technology) toward one industry or sector instead of another.
 
@@ -432,11 +615,11 @@ CONCRETE EXAMPLES:
 
 4. China's Industrial Policy
    • China's massive investment in solar panel manufacturing meant reduced investment in other sectors like biotechnology or consumer services, but positioned them as the global leader in renewable energy equipment.""",
-    ),
-    # Question 3
-    (
-        "QUESTION 3: Advantage Types\nDistinguish between a country's absolute advantage and comparative advantage. Provide examples of each to demonstrate the difference.",
-        """ANSWER:
+        ),
+        # Question 3
+        (
+            "QUESTION 3: Advantage Types\nDistinguish between a country's absolute advantage and comparative advantage. Provide examples of each to demonstrate the difference.",
+            """ANSWER:
 
 ABSOLUTE ADVANTAGE (Adam Smith):
 A country has an absolute advantage when it can produce a good using fewer resources (labor, capital, time) than another country. It's about being "better" in absolute terms.
@@ -470,11 +653,11 @@ Consider two countries producing wine and cloth:
 
 REAL-WORLD EXAMPLE:
 The U.S. could produce textiles domestically, but the opportunity cost is high (those workers could be producing semiconductors, software, or pharmaceuticals). Bangladesh has comparative advantage in textiles because its opportunity cost of textile production is lower – its alternative employment opportunities in high-tech sectors are limited.""",
-    ),
-    # Question 4
-    (
-        "QUESTION 4: Labor and Trade Policy\na) Do low-wage countries possess an 'unfair' advantage in the production of goods?\nb) Should this wage disparity influence US trade policy?\nc) Explain how labor productivity should theoretically drive wage levels.",
-        """ANSWER:
+        ),
+        # Question 4
+        (
+            "QUESTION 4: Labor and Trade Policy\na) Do low-wage countries possess an 'unfair' advantage in the production of goods?\nb) Should this wage disparity influence US trade policy?\nc) Explain how labor productivity should theoretically drive wage levels.",
+            """ANSWER:
 
 a) DO LOW-WAGE COUNTRIES POSSESS AN "UNFAIR" ADVANTAGE?
 
@@ -521,11 +704,11 @@ EMPIRICAL EVIDENCE:
 • U.S. manufacturing productivity rose 3.4% annually (1950-2000); real wages tracked closely
 • Countries that invest in education, technology, and infrastructure see wage increases
 • "Middle-income trap" occurs when productivity stagnates despite rising wages""",
-    ),
-    # Question 5
-    (
-        "QUESTION 5: Specialization\nUnder what circumstances, if ever, should a country focus on complete specialization (producing a strictly restricted range of products) to enhance efficiency?",
-        """ANSWER:
+        ),
+        # Question 5
+        (
+            "QUESTION 5: Specialization\nUnder what circumstances, if ever, should a country focus on complete specialization (producing a strictly restricted range of products) to enhance efficiency?",
+            """ANSWER:
 
 ARGUMENTS FOR COMPLETE SPECIALIZATION:
 
@@ -571,11 +754,11 @@ Countries should:
 • Use trade policy to facilitate gradual transitions, not permanent protection
 
 EXAMPLE: South Korea transitioned from textiles → shipbuilding → electronics → semiconductors → content/entertainment, maintaining specialization within each phase while building new comparative advantages.""",
-    ),
-    # Question 6
-    (
-        "QUESTION 6: Efficiency Types\nDefine and differentiate between allocative efficiency and productive efficiency. Provide specific examples for each concept.",
-        """ANSWER:
+        ),
+        # Question 6
+        (
+            "QUESTION 6: Efficiency Types\nDefine and differentiate between allocative efficiency and productive efficiency. Provide specific examples for each concept.",
+            """ANSWER:
 
 PRODUCTIVE EFFICIENCY:
 Producing goods and services at the lowest possible cost, using the optimal combination of inputs. This occurs when a firm/economy operates on its production possibilities frontier (PPF).
@@ -621,51 +804,72 @@ KEY DIFFERENCES:
 
 IMPORTANT RELATIONSHIP:
 An economy can be productively efficient but allocatively inefficient. Example: The Soviet Union efficiently produced millions of tanks (productive efficiency) but consumers wanted cars and consumer goods (allocative inefficiency).""",
-    ),
-]
+        ),
+    ]
 
-row = 3
-for q_num, (question, answer) in enumerate(questions_answers, start=1):
-    # Question box
-    ws5.set_row(row - 1, 60)  # Height for question
-    ws5.write(row - 1, 0, question, question_format)
-
-    # Answer box
-    answer_height = max(200, len(answer) // 3)  # Approximate row height
-    ws5.set_row(row, answer_height)
-    ws5.write(row, 0, answer, answer_format)
-
-    row += 3  # Skip a row between Q&A pairs
-
-# Data Sources Summary
-ws5.write(row, 0, "DATA SOURCES FOR THIS WORKBOOK:", header_format)
-ws5.set_row(row, 20)
-row += 1
-
-sources = [
-    "1. U.S. Census Bureau, Foreign Trade Division: https://www.census.gov/foreign-trade/",
-    "2. Bureau of Economic Analysis, International Trade in Goods and Services: https://www.bea.gov/data/intl-trade-investment/international-trade-goods-and-services",
-    "3. Office of the United States Trade Representative: https://ustr.gov/countries-regions",
-    "4. Federal Reserve Economic Data (FRED): https://fred.stlouisfed.org/",
-    "",
-    "Report Generated: " + datetime.now().strftime("%B %d, %Y"),
-]
+    row = 3
+    for q_num, (question, answer) in enumerate(questions_answers, start=1):
+        # Question box
+        ws5.set_row(row - 1, 60)  # Height for question
+        ws5.write(row - 1, 0, question, question_format)
+
+        # Answer box
+        answer_height = max(200, len(answer) // 3)  # Approximate row height
+        ws5.set_row(row, answer_height)
+        ws5.write(row, 0, answer, answer_format)
+
+        row += 3  # Skip a row between Q&A pairs
 
-for source in sources:
-    ws5.write(row, 0, source, source_format)
+    # Data Sources Summary
+    ws5.write(row, 0, "DATA SOURCES FOR THIS WORKBOOK:", header_format)
+    ws5.set_row(row, 20)
     row += 1
 
-# Close workbook
-workbook.close()
-
-print("✅ Excel workbook 'US_Trade_Analysis_2024.xlsx' created successfully!")
-print("\nWorkbook contains 5 worksheets:")
-print("  1. Imports by Industry - US imports by industrial sector with pie chart")
-print("  2. Exports by Industry - US exports by industrial sector with pie chart")
-print("  3. Imports by Partner - US imports by top 5 trading partners with pie chart")
-print("  4. Exports by Partner - US exports by top 5 trading partners with pie chart")
-print("  5. Economic Questions - 6 economic theory questions with detailed answers")
-print("\nData Sources:")
-print("  • U.S. Census Bureau Foreign Trade Division")
-print("  • Bureau of Economic Analysis")
-print("  • Office of the United States Trade Representative")
+    sources = [
+        "1. U.S. Census Bureau, Foreign Trade Division: https://www.census.gov/foreign-trade/",
+        "2. Bureau of Economic Analysis, International Trade in Goods and Services: https://www.bea.gov/data/intl-trade-investment/international-trade-goods-and-services",
+        "3. Office of the United States Trade Representative: https://ustr.gov/countries-regions",
+        "4. Federal Reserve Economic Data (FRED): https://fred.stlouisfed.org/",
+        "",
+        "Report Generated: " + datetime.now().strftime("%B %d, %Y"),
+    ]
+
+    for source in sources:
+        ws5.write(row, 0, source, source_format)
+        row += 1
+
+    # Close workbook
+    workbook.close()
+
+    figures = [
+        (figure1_title, "Industry Sector", imports_by_sector, sector_source),
+        (figure2_title, "Industry Sector", exports_by_sector, sector_source),
+        (figure3_title, "Trading Partner", imports_by_partner, partner_source),
+        (figure4_title, "Trading Partner", exports_by_partner, partner_source),
+    ]
+
+    build_pdf_report("US_Trade_Analysis_2024.pdf", figures, questions_answers, sources)
+
+    print("✅ Excel workbook 'US_Trade_Analysis_2024.xlsx' created successfully!")
+    print("\nWorkbook contains 5 worksheets:")
+    print("  1. Imports by Industry - US imports by industrial sector with pie chart")
+    print("  2. Exports by Industry - US exports by industrial sector with pie chart")
+    print(
+        "  3. Imports by Partner - US imports by top 5 trading partners with pie chart"
+    )
+    print(
+        "  4. Exports by Partner - US exports by top 5 trading partners with pie chart"
+    )
+    print("  5. Economic Questions - 6 economic theory questions with detailed answers")
+    print("\n✅ PDF report 'US_Trade_Analysis_2024.pdf' created successfully!")
+    print(
+        "  Figures 1-4 with tables and citations, followed by the 6 written responses"
+    )
+    print("\nData Sources:")
+    print("  • U.S. Census Bureau Foreign Trade Division")
+    print("  • Bureau of Economic Analysis")
+    print("  • Office of the United States Trade Representative")
+
+
+if __name__ == "__main__":
+    main()